@@ -0,0 +1,148 @@
+//! Batched GET requests for polling clients.
+//!
+//! `POST /api/bulk` with `{"endpoints": ["/api/status", "/api/profiles"]}`
+//! runs each GET through the regular API router (including ETag handling)
+//! and returns every response in a single round-trip:
+//!
+//! ```json
+//! {"/api/status": {"status": 200, "etag": "\"...\"", "body": {...}}}
+//! ```
+//!
+//! Each entry carries the ETag a single GET would have returned, so clients
+//! can keep revalidating endpoints individually with `If-None-Match`.
+
+use axum::{
+    body::{to_bytes, Body},
+    extract::State,
+    http::{header, Request},
+    middleware,
+    routing::post,
+    Json, Router,
+};
+use serde::Deserialize;
+use serde_json::{json, Map, Value};
+use std::sync::Arc;
+use tower::ServiceExt;
+
+use crate::web::api::{self, ApiError};
+use crate::web::{etag, AppState};
+
+/// Upper bound on endpoints per bulk request
+const MAX_ENDPOINTS: usize = 16;
+
+pub fn create_router(state: Arc<AppState>) -> Router {
+    // Built once; each bulk request dispatches into a clone of it
+    let api = Router::new().nest(
+        "/api",
+        api::create_router(state).layer(middleware::from_fn(etag::etag_middleware)),
+    );
+
+    Router::new()
+        .route("/bulk", post(bulk_handler))
+        .with_state(api)
+}
+
+#[derive(Deserialize)]
+struct BulkRequest {
+    endpoints: Vec<String>,
+}
+
+/// POST /api/bulk - Fetch several GET endpoints at once
+async fn bulk_handler(
+    State(api): State<Router>,
+    Json(request): Json<BulkRequest>,
+) -> Result<Json<Value>, ApiError> {
+    if request.endpoints.len() > MAX_ENDPOINTS {
+        return Err(ApiError::BadRequest(format!(
+            "At most {} endpoints per bulk request",
+            MAX_ENDPOINTS
+        )));
+    }
+    if let Some(endpoint) = request
+        .endpoints
+        .iter()
+        .find(|endpoint| !endpoint.starts_with("/api/"))
+    {
+        return Err(ApiError::BadRequest(format!(
+            "Invalid bulk endpoint: {}",
+            endpoint
+        )));
+    }
+
+    let mut responses = Map::new();
+    for endpoint in request.endpoints {
+        let entry = fetch(api.clone(), &endpoint).await?;
+        responses.insert(endpoint, entry);
+    }
+    Ok(Json(Value::Object(responses)))
+}
+
+/// Run a GET through the API router and describe its response.
+///
+/// Bodies that are not JSON (or empty, e.g. for unknown routes) are
+/// reported as `null`.
+async fn fetch(api: Router, endpoint: &str) -> Result<Value, ApiError> {
+    let request = Request::get(endpoint)
+        .body(Body::empty())
+        .map_err(|e| ApiError::BadRequest(format!("Invalid bulk endpoint {}: {}", endpoint, e)))?;
+    let response = match api.oneshot(request).await {
+        Ok(response) => response,
+        Err(never) => match never {},
+    };
+
+    let status = response.status().as_u16();
+    let etag = response
+        .headers()
+        .get(header::ETAG)
+        .and_then(|value| value.to_str().ok())
+        .map(str::to_owned);
+    let bytes = to_bytes(response.into_body(), usize::MAX)
+        .await
+        .map_err(|e| ApiError::InternalError(format!("Failed to read {}: {}", endpoint, e)))?;
+    let body = serde_json::from_slice(&bytes).unwrap_or(Value::Null);
+
+    Ok(json!({ "status": status, "etag": etag, "body": body }))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use axum::routing::get;
+
+    fn test_api() -> Router {
+        Router::new()
+            .route(
+                "/api/status",
+                get(|| async { Json(json!({"running": true})) }),
+            )
+            .layer(middleware::from_fn(etag::etag_middleware))
+    }
+
+    #[tokio::test]
+    async fn test_bulk_returns_bodies_and_etags() {
+        let request = BulkRequest {
+            endpoints: vec!["/api/status".to_string(), "/api/missing".to_string()],
+        };
+        let Json(responses) = bulk_handler(State(test_api()), Json(request))
+            .await
+            .unwrap();
+
+        let status = &responses["/api/status"];
+        assert_eq!(status["status"], 200);
+        assert_eq!(status["body"], json!({"running": true}));
+        assert!(status["etag"].is_string());
+
+        let missing = &responses["/api/missing"];
+        assert_eq!(missing["status"], 404);
+        assert!(missing["body"].is_null());
+    }
+
+    #[tokio::test]
+    async fn test_bulk_rejects_non_api_endpoints() {
+        let request = BulkRequest {
+            endpoints: vec!["/index.html".to_string()],
+        };
+        let result = bulk_handler(State(test_api()), Json(request)).await;
+        assert!(matches!(result, Err(ApiError::BadRequest(_))));
+    }
+}
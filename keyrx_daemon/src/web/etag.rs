@@ -0,0 +1,191 @@
+//! Conditional GET support for JSON API responses.
+//!
+//! Successful JSON GET responses carry an ETag derived from a hash of the
+//! body. Requests whose `If-None-Match` matches it receive `304 Not Modified`
+//! with an empty body, so polling clients (e.g. the system tray) only pay for
+//! headers when nothing has changed.
+
+use axum::{
+    body::{to_bytes, Body},
+    extract::Request,
+    http::{header, HeaderValue, Method, StatusCode},
+    middleware::Next,
+    response::{IntoResponse, Response},
+};
+use std::collections::hash_map::DefaultHasher;
+use std::hash::{Hash, Hasher};
+
+/// Middleware adding ETag / If-None-Match handling to JSON GET responses.
+///
+/// Streaming responses (e.g. server-sent events) are passed through
+/// untouched since only `application/json` bodies are buffered.
+pub async fn etag_middleware(request: Request, next: Next) -> Response {
+    if request.method() != Method::GET {
+        return next.run(request).await;
+    }
+
+    let if_none_match = request.headers().get(header::IF_NONE_MATCH).cloned();
+    let response = next.run(request).await;
+
+    let is_json = response
+        .headers()
+        .get(header::CONTENT_TYPE)
+        .and_then(|value| value.to_str().ok())
+        .is_some_and(|value| value.starts_with("application/json"));
+    if response.status() != StatusCode::OK
+        || !is_json
+        || response.headers().contains_key(header::ETAG)
+    {
+        return response;
+    }
+
+    let (mut parts, body) = response.into_parts();
+    let bytes = match to_bytes(body, usize::MAX).await {
+        Ok(bytes) => bytes,
+        Err(e) => {
+            log::warn!("Failed to buffer response body for ETag: {}", e);
+            return StatusCode::INTERNAL_SERVER_ERROR.into_response();
+        }
+    };
+
+    let Some(etag) = body_etag(&bytes) else {
+        return Response::from_parts(parts, Body::from(bytes));
+    };
+
+    if if_none_match.is_some_and(|value| etag_matches(&value, &etag)) {
+        return (StatusCode::NOT_MODIFIED, [(header::ETAG, etag)]).into_response();
+    }
+
+    parts.headers.insert(header::ETAG, etag);
+    Response::from_parts(parts, Body::from(bytes))
+}
+
+/// Compute a strong ETag for a response body.
+fn body_etag(body: &[u8]) -> Option<HeaderValue> {
+    let mut hasher = DefaultHasher::new();
+    body.hash(&mut hasher);
+    HeaderValue::try_from(format!("\"{:016x}\"", hasher.finish())).ok()
+}
+
+/// Check an `If-None-Match` header against an ETag (weak comparison).
+fn etag_matches(if_none_match: &HeaderValue, etag: &HeaderValue) -> bool {
+    let (Ok(candidates), Ok(etag)) = (if_none_match.to_str(), etag.to_str()) else {
+        return false;
+    };
+
+    candidates.split(',').map(str::trim).any(|candidate| {
+        candidate == "*" || candidate.strip_prefix("W/").unwrap_or(candidate) == etag
+    })
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use axum::{
+        middleware,
+        response::sse::{Event, Sse},
+        routing::get,
+        Json, Router,
+    };
+    use futures_util::stream;
+    use serde_json::json;
+    use std::convert::Infallible;
+    use std::time::Duration;
+    use tower::ServiceExt;
+
+    fn test_router() -> Router {
+        Router::new()
+            .route(
+                "/api/status",
+                get(|| async { Json(json!({"running": true})) }),
+            )
+            .route(
+                "/api/events",
+                get(|| async {
+                    // Never yields, like an idle event stream
+                    Sse::new(stream::pending::<Result<Event, Infallible>>())
+                }),
+            )
+            .layer(middleware::from_fn(etag_middleware))
+    }
+
+    fn get_request(uri: &str, if_none_match: Option<&HeaderValue>) -> Request {
+        let mut builder = axum::http::Request::get(uri);
+        if let Some(etag) = if_none_match {
+            builder = builder.header(header::IF_NONE_MATCH, etag);
+        }
+        builder.body(Body::empty()).unwrap()
+    }
+
+    #[tokio::test]
+    async fn test_matching_if_none_match_returns_304() {
+        let response = test_router()
+            .oneshot(get_request("/api/status", None))
+            .await
+            .unwrap();
+        assert_eq!(response.status(), StatusCode::OK);
+        let etag = response.headers().get(header::ETAG).unwrap().clone();
+
+        let response = test_router()
+            .oneshot(get_request("/api/status", Some(&etag)))
+            .await
+            .unwrap();
+        assert_eq!(response.status(), StatusCode::NOT_MODIFIED);
+        assert_eq!(response.headers().get(header::ETAG), Some(&etag));
+        let body = to_bytes(response.into_body(), usize::MAX).await.unwrap();
+        assert!(body.is_empty());
+    }
+
+    #[tokio::test]
+    async fn test_event_stream_is_not_buffered() {
+        // Buffering an endless SSE body would never return
+        let response = tokio::time::timeout(
+            Duration::from_secs(1),
+            test_router().oneshot(get_request("/api/events", None)),
+        )
+        .await
+        .expect("SSE response was buffered")
+        .unwrap();
+
+        assert_eq!(response.status(), StatusCode::OK);
+        assert_eq!(
+            response.headers().get(header::CONTENT_TYPE),
+            Some(&HeaderValue::from_static("text/event-stream"))
+        );
+        assert!(response.headers().get(header::ETAG).is_none());
+    }
+
+    #[test]
+    fn test_body_etag_is_stable_and_content_dependent() {
+        let a = body_etag(br#"{"profile":"default"}"#);
+        let b = body_etag(br#"{"profile":"default"}"#);
+        let c = body_etag(br#"{"profile":"gaming"}"#);
+
+        assert!(a.is_some());
+        assert_eq!(a, b);
+        assert_ne!(a, c);
+    }
+
+    #[test]
+    fn test_etag_matches() {
+        let etag = HeaderValue::from_static("\"00000000000000ff\"");
+
+        assert!(etag_matches(
+            &HeaderValue::from_static("\"00000000000000ff\""),
+            &etag
+        ));
+        assert!(etag_matches(
+            &HeaderValue::from_static("W/\"00000000000000ff\""),
+            &etag
+        ));
+        assert!(etag_matches(
+            &HeaderValue::from_static("\"0000000000000001\", \"00000000000000ff\""),
+            &etag
+        ));
+        assert!(etag_matches(&HeaderValue::from_static("*"), &etag));
+        assert!(!etag_matches(
+            &HeaderValue::from_static("\"0000000000000001\""),
+            &etag
+        ));
+    }
+}
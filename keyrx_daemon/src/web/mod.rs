@@ -1,17 +1,22 @@
 pub mod api;
+pub mod bulk;
 pub mod error;
+pub mod etag;
 pub mod events;
 pub mod handlers;
 pub mod rpc_types;
+pub mod sse;
 pub mod static_files;
 pub mod subscriptions;
+#[cfg(unix)]
+pub mod unix_socket;
 pub mod ws;
 pub mod ws_rpc;
 
 #[cfg(test)]
 mod ws_test;
 
-use axum::Router;
+use axum::{middleware, Router};
 use std::net::SocketAddr;
 use std::sync::Arc;
 use tokio::sync::broadcast;
@@ -117,7 +122,13 @@ pub async fn create_app(event_tx: broadcast::Sender<DaemonEvent>, state: Arc<App
         .allow_headers(Any);
 
     Router::new()
-        .nest("/api", api::create_router(Arc::clone(&state)))
+        .nest(
+            "/api",
+            api::create_router(Arc::clone(&state))
+                .merge(sse::create_router(Arc::clone(&state)))
+                .merge(bulk::create_router(Arc::clone(&state)))
+                .layer(middleware::from_fn(etag::etag_middleware)),
+        )
         .nest("/ws", ws::create_router(event_tx))
         .nest("/ws-rpc", ws_rpc::create_router(Arc::clone(&state)))
         .fallback_service(static_files::serve_static())
@@ -131,6 +142,18 @@ pub async fn serve(
     state: Arc<AppState>,
 ) -> Result<(), Box<dyn std::error::Error>> {
     let app = create_app(event_tx, state).await;
+
+    #[cfg(unix)]
+    if let Some(path) = std::env::var_os(unix_socket::SOCKET_ENV) {
+        let app = app.clone();
+        tokio::spawn(async move {
+            let path = std::path::PathBuf::from(path);
+            if let Err(e) = unix_socket::serve(&path, app).await {
+                log::error!("Unix socket web server error: {}", e);
+            }
+        });
+    }
+
     let listener = tokio::net::TcpListener::bind(addr).await?;
     axum::serve(listener, app).await?;
     Ok(())
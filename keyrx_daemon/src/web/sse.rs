@@ -0,0 +1,141 @@
+//! Server-sent events endpoint for lightweight state subscribers.
+//!
+//! This module provides an SSE endpoint at /api/events for clients that only
+//! need to know when the active profile changed (e.g. the system tray), so
+//! they can block on a single long-lived HTTP response instead of polling
+//! frequently. Only profile activation events are forwarded; modifier, key
+//! and latency updates remain available on the /ws endpoint.
+
+use axum::{
+    extract::State,
+    response::sse::{Event, KeepAlive, Sse},
+    routing::get,
+    Router,
+};
+use futures_util::stream::{self, Stream};
+use serde_json::{json, Value};
+use std::sync::Arc;
+use tokio::sync::broadcast::{self, error::RecvError};
+use tokio::time::Duration;
+
+use crate::web::rpc_types::ServerMessage;
+use crate::web::AppState;
+
+pub fn create_router(state: Arc<AppState>) -> Router {
+    Router::new()
+        .route("/events", get(sse_handler))
+        .with_state(state)
+}
+
+/// SSE subscription handler
+async fn sse_handler(
+    State(state): State<Arc<AppState>>,
+) -> Sse<impl Stream<Item = Result<Event, axum::Error>>> {
+    log::info!("SSE client connected");
+
+    Sse::new(profile_events(state.event_broadcaster.subscribe()))
+        .keep_alive(KeepAlive::new().interval(Duration::from_secs(30)))
+}
+
+/// Build the SSE payload for a server message.
+///
+/// Returns `{"channel": ..., "data": ...}` for profile activation events and
+/// `None` for everything else.
+fn profile_event_payload(message: &ServerMessage) -> Option<Value> {
+    match message {
+        ServerMessage::Event { channel, data }
+            if channel == "profiles"
+                && data.get("action").and_then(|action| action.as_str()) == Some("activated") =>
+        {
+            Some(json!({ "channel": channel, "data": data }))
+        }
+        _ => None,
+    }
+}
+
+/// Convert a server message receiver into a stream of SSE frames.
+///
+/// Only profile activation events are forwarded; everything else is skipped.
+fn profile_events(
+    event_rx: broadcast::Receiver<ServerMessage>,
+) -> impl Stream<Item = Result<Event, axum::Error>> {
+    stream::unfold(event_rx, |mut event_rx| async move {
+        loop {
+            match event_rx.recv().await {
+                Ok(message) => {
+                    if let Some(payload) = profile_event_payload(&message) {
+                        return Some((Event::default().json_data(payload), event_rx));
+                    }
+                }
+                Err(RecvError::Lagged(skipped)) => {
+                    log::debug!("SSE client lagged, skipped {} events", skipped);
+                }
+                Err(RecvError::Closed) => {
+                    log::info!("SSE stream closed");
+                    return None;
+                }
+            }
+        }
+    })
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use axum::body::to_bytes;
+    use axum::response::IntoResponse;
+
+    #[test]
+    fn test_profile_event_payload() {
+        let payload = profile_event_payload(&ServerMessage::Event {
+            channel: "profiles".to_string(),
+            data: json!({"action": "activated", "profile": "gaming"}),
+        });
+        assert_eq!(
+            payload,
+            Some(json!({
+                "channel": "profiles",
+                "data": {"action": "activated", "profile": "gaming"}
+            }))
+        );
+
+        assert!(profile_event_payload(&ServerMessage::Event {
+            channel: "profiles".to_string(),
+            data: json!({"action": "deleted", "profile": "gaming"}),
+        })
+        .is_none());
+        assert!(profile_event_payload(&ServerMessage::Event {
+            channel: "devices".to_string(),
+            data: json!({"action": "activated"}),
+        })
+        .is_none());
+    }
+
+    #[tokio::test]
+    async fn test_profile_events_skips_other_events() {
+        let (event_tx, event_rx) = broadcast::channel(100);
+
+        event_tx
+            .send(ServerMessage::Event {
+                channel: "devices".to_string(),
+                data: json!({"action": "updated"}),
+            })
+            .unwrap();
+        event_tx
+            .send(ServerMessage::Event {
+                channel: "profiles".to_string(),
+                data: json!({"action": "activated", "profile": "gaming"}),
+            })
+            .unwrap();
+        drop(event_tx);
+
+        // The body ends once the sender is dropped, so it holds exactly the
+        // frames a subscriber would receive.
+        let response = Sse::new(profile_events(event_rx)).into_response();
+        let body = to_bytes(response.into_body(), usize::MAX).await.unwrap();
+        assert_eq!(
+            std::str::from_utf8(&body).unwrap(),
+            "data: {\"channel\":\"profiles\",\"data\":{\"action\":\"activated\",\"profile\":\"gaming\"}}\n\n"
+        );
+    }
+}
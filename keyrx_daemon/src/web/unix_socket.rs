@@ -0,0 +1,91 @@
+//! Web API listener on a Unix domain socket.
+//!
+//! `axum::serve` in axum 0.7 only accepts a `TcpListener`, so connections
+//! are accepted here and handed to hyper directly. Local clients such as the
+//! system tray can then talk to the daemon without going through the TCP/IP
+//! stack. The socket is enabled by setting `KEYRX_API_SOCKET` to its path.
+
+use axum::Router;
+use hyper_util::rt::{TokioExecutor, TokioIo};
+use hyper_util::server::conn::auto::Builder;
+use hyper_util::service::TowerToHyperService;
+use std::io;
+use std::os::unix::fs::PermissionsExt;
+use std::path::Path;
+use tokio::net::UnixListener;
+
+/// Environment variable holding the socket path
+pub const SOCKET_ENV: &str = "KEYRX_API_SOCKET";
+
+/// Serve `app` on a Unix domain socket at `path` until an error occurs.
+pub async fn serve(path: &Path, app: Router) -> io::Result<()> {
+    // A socket left behind by a previous run would make bind() fail
+    match std::fs::remove_file(path) {
+        Ok(()) => {}
+        Err(e) if e.kind() == io::ErrorKind::NotFound => {}
+        Err(e) => return Err(e),
+    }
+
+    let listener = UnixListener::bind(path)?;
+    // Same reach as the TCP listener on 127.0.0.1: any local user. The
+    // daemon usually runs as root while the tray runs as the desktop user.
+    std::fs::set_permissions(path, std::fs::Permissions::from_mode(0o666))?;
+    log::info!("Starting web server on unix:{}", path.display());
+
+    loop {
+        let (stream, _) = match listener.accept().await {
+            Ok(connection) => connection,
+            Err(e) => {
+                log::warn!("Failed to accept unix socket connection: {}", e);
+                continue;
+            }
+        };
+
+        let service = TowerToHyperService::new(app.clone());
+        tokio::spawn(async move {
+            // with_upgrades keeps the WebSocket endpoints working
+            if let Err(e) = Builder::new(TokioExecutor::new())
+                .serve_connection_with_upgrades(TokioIo::new(stream), service)
+                .await
+            {
+                log::debug!("Unix socket connection error: {}", e);
+            }
+        });
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use axum::routing::get;
+    use tokio::io::{AsyncReadExt, AsyncWriteExt};
+    use tokio::net::UnixStream;
+
+    #[tokio::test]
+    async fn test_serves_requests_over_unix_socket() {
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("keyrx.sock");
+        // A stale file at the socket path is replaced
+        std::fs::write(&path, b"stale").unwrap();
+
+        let app = Router::new().route("/api/health", get(|| async { "ok" }));
+        let server_path = path.clone();
+        tokio::spawn(async move { serve(&server_path, app).await });
+
+        let mut stream = loop {
+            match UnixStream::connect(&path).await {
+                Ok(stream) => break stream,
+                Err(_) => tokio::time::sleep(std::time::Duration::from_millis(10)).await,
+            }
+        };
+        stream
+            .write_all(b"GET /api/health HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n")
+            .await
+            .unwrap();
+        let mut response = String::new();
+        stream.read_to_string(&mut response).await.unwrap();
+
+        assert!(response.starts_with("HTTP/1.1 200 OK"));
+        assert!(response.ends_with("ok"));
+    }
+}
@@ -9,23 +9,189 @@ Controls daemon, switches profiles, and provides quick access to web UI.
 import gi
 import os
 import sys
+import json
 import signal
-import requests
-import subprocess
-import webbrowser
-from typing import Optional
+import threading
+import time
+import importlib.util
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson  # Optional, several times faster than stdlib json
+except ImportError:
+    orjson = None
 
 gi.require_version('Gtk', '3.0')
 gi.require_version('AppIndicator3', '0.1')
 gi.require_version('Notify', '0.7')
 
-from gi.repository import Gtk, AppIndicator3, GLib, Notify
+from gi.repository import Gtk, AppIndicator3, GLib, Gio, Notify
 
 # Configuration
+# http+unix://%2Frun%2Fkeyrx.sock talks to the daemon over a Unix socket
+# (daemon started with KEYRX_API_SOCKET; needs requests-unixsocket)
 DAEMON_API_BASE = os.getenv('KEYRX_API_URL', 'http://127.0.0.1:9867')
+UNIX_SOCKET_SCHEME = 'http+unix://'
 WEB_UI_URL = os.getenv('KEYRX_WEB_UI', 'http://127.0.0.1:9867')
 MOCK_MODE = os.getenv('KEYRX_MOCK', '0') == '1'
-UPDATE_INTERVAL = 5000  # ms
+# Status poll intervals (seconds); the event stream only reports profile
+# switches, so remapping state still relies on polling
+try:
+    POLL_INTERVAL = max(1, int(os.getenv('KEYRX_POLL_INTERVAL', '5')))  # menu open
+except ValueError:
+    print("Warning: KEYRX_POLL_INTERVAL must be an integer, using 5", file=sys.stderr)
+    POLL_INTERVAL = 5
+BACKGROUND_POLL_INTERVAL = max(POLL_INTERVAL, 30)  # menu closed
+MAX_POLL_INTERVAL = max(POLL_INTERVAL, 60)  # backoff cap while daemon is down
+
+# Client-side response cache lifetimes (seconds); stale entries are
+# revalidated with If-None-Match
+CACHE_TTL = {
+    "/api/status": 3,
+    "/api/profiles": 30,
+}
+# Consecutive failed status updates before the last known status is discarded
+# and the daemon is reported as not running
+STALE_FAILURE_LIMIT = 3
+# The daemon is local, so connecting should be near-instant; a short
+# connect timeout (plus a quick retry) recovers faster from restarts
+CONNECT_TIMEOUT = 0.3  # seconds
+READ_TIMEOUT = 1.5  # seconds
+# Bursts of toggle/profile clicks within this window send one request
+CLICK_DEBOUNCE = 150  # ms
+
+
+def json_loads(data):
+    """Parse JSON from bytes or str"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def json_dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON"""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def create_session() -> "requests.Session":
+    """HTTP session holding a single keep-alive connection to the daemon"""
+    # Imported on first use: requests pulls in urllib3, ssl, idna, etc.,
+    # which would otherwise delay the tray icon at login
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
+
+    session = requests.Session()
+    # Connection errors are retried for every method: the request never
+    # reached the daemon. Read timeouts are not, so a hung daemon costs one
+    # READ_TIMEOUT. 502/503/504 are retried for idempotent methods only.
+    retry = Retry(
+        connect=2, read=0, status=2,
+        backoff_factor=0.05, status_forcelist=[502, 503, 504]
+    )
+    if DAEMON_API_BASE.startswith(UNIX_SOCKET_SCHEME):
+        import requests_unixsocket
+
+        # UnixAdapter keeps one pooled connection per URL
+        adapter = requests_unixsocket.UnixAdapter(max_retries=retry)
+        session.mount(UNIX_SOCKET_SCHEME, adapter)
+    else:
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+    return session
+
+
+_session: Optional["requests.Session"] = None
+
+
+def daemon_session() -> "requests.Session":
+    """Shared session for daemon API requests
+
+    Not thread-safe: only the tray's single HTTP worker uses it.
+    """
+    global _session
+    if _session is None:
+        _session = create_session()
+    return _session
+
+
+class EventStream:
+    """Subscription to the daemon's server-sent event stream.
+
+    The HTTP response is read on a background thread; each parsed event is
+    handed to ``on_event`` on the GTK main loop via ``GLib.idle_add``.
+    ``on_disconnect`` is called the same way once the stream ends.
+    """
+
+    def __init__(self, url: str, on_event, on_disconnect):
+        self.url = url
+        self.on_event = on_event
+        self.on_disconnect = on_disconnect
+        self.supported = True
+        # Separate from daemon_session(): the stream holds its connection
+        self.session = None
+        self._thread = None
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Connect in the background (no-op if already connected)"""
+        if self.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            if self.session is None:
+                self.session = create_session()
+            # The daemon sends a keep-alive comment every 30s, so a read
+            # timeout well above that detects a silently dropped connection.
+            with self.session.get(
+                self.url,
+                headers={"Accept": "text/event-stream"},
+                stream=True,
+                timeout=(CONNECT_TIMEOUT, 90)
+            ) as response:
+                if response.status_code != 404:
+                    response.raise_for_status()
+                content_type = response.headers.get("Content-Type", "")
+                if not content_type.startswith("text/event-stream"):
+                    # Daemon predates /api/events: unknown routes serve the
+                    # web UI (or a 404), not an event stream
+                    self.supported = False
+                    return
+                self.supported = True
+                data = []
+                for line in response.iter_lines(decode_unicode=True):
+                    if line:
+                        if line.startswith("data:"):
+                            data.append(line[5:].lstrip())
+                        continue
+                    # A blank line terminates the frame
+                    if data:
+                        self._dispatch("\n".join(data))
+                        data = []
+        except Exception as e:
+            print(f"Event stream error: {e}", file=sys.stderr)
+        finally:
+            GLib.idle_add(self.on_disconnect)
+
+    def _dispatch(self, payload: str):
+        try:
+            event = json_loads(payload)
+        except ValueError:
+            print(f"Malformed event: {payload!r}", file=sys.stderr)
+            return
+        GLib.idle_add(self.on_event, event)
+
 
 class KeyRxTray:
     def __init__(self):
@@ -39,19 +205,61 @@ class KeyRxTray:
             AppIndicator3.IndicatorCategory.HARDWARE
         )
         self.indicator.set_status(AppIndicator3.IndicatorStatus.ACTIVE)
+        self.indicator.set_icon_full("input-keyboard", "KeyRx")
 
         # State
         self.daemon_running = False
         self.current_profile = None
         self.remapping_enabled = True
+        self._poll_source = None
+        self._backoff_interval = POLL_INTERVAL
+        # None until the first show/hide signal: AppIndicator hosts do not
+        # always emit them, so menu updates are only deferred once a "hide"
+        # has actually been seen.
+        self._menu_visible: Optional[bool] = None
+        # (status label, remapping enabled) awaiting display in the menu
+        self._menu_state: Optional[Tuple[str, Optional[bool]]] = None
+        # Last values pushed to GTK, to skip no-op widget updates
+        self._last_label: Optional[str] = None
+        self._last_enabled: Optional[bool] = None
+        # (icon name, description) last sent to the indicator; every change
+        # is a DBus update to the StatusNotifierWatcher
+        self._current_icon: Tuple[str, str] = ("input-keyboard", "KeyRx")
+        # name -> (item, "activate" handler id), plus the (name, active)
+        # signature they were built from; None means no profile data
+        self._profile_items: Dict[str, Tuple[Gtk.CheckMenuItem, int]] = {}
+        self._profiles_signature: Optional[tuple] = ()
+        # Set when a click changed profile items locally
+        self._profiles_dirty = False
+        # Debounce timers and in-flight guards for user actions
+        self._toggle_source = None
+        self._toggle_inflight = False
+        self._profile_source = None
+        self._profile_inflight = False
+        self._pending_profile: Optional[str] = None
+        # endpoint -> (expiry, etag, body)
+        self._cache: Dict[str, Tuple[float, Optional[str], dict]] = {}
+        self._failed_polls = 0
+        self._bulk_supported = True
+        # All daemon requests run here, one at a time, so the GTK main loop
+        # never blocks on the network. Cache state is only touched here too.
+        self._http = ThreadPoolExecutor(max_workers=1, thread_name_prefix="keyrx-http")
 
         # Build menu
         self.menu = self.build_menu()
+        self.menu.connect("show", self.on_menu_show)
+        self.menu.connect("hide", self.on_menu_hide)
         self.indicator.set_menu(self.menu)
 
-        # Start status polling
-        GLib.timeout_add(UPDATE_INTERVAL, self.update_status)
-        self.update_status()  # Initial update
+        # Subscribe to profile switch events; polling keeps running alongside
+        self.event_stream = EventStream(
+            f"{DAEMON_API_BASE}/api/events",
+            self.on_daemon_event,
+            self.on_event_stream_closed
+        )
+        # Initial update, deferred until the main loop runs so the icon and
+        # menu appear without waiting on the daemon
+        GLib.idle_add(self.update_status, self.start_updates)
 
     def build_menu(self):
         """Build system tray menu"""
@@ -67,7 +275,9 @@ class KeyRxTray:
         # Enable/Disable toggle
         self.toggle_item = Gtk.CheckMenuItem(label="Enable Remapping")
         self.toggle_item.set_active(True)
-        self.toggle_item.connect("activate", self.on_toggle_remapping)
+        self._toggle_handler_id = self.toggle_item.connect(
+            "activate", self.on_toggle_remapping
+        )
         menu.append(self.toggle_item)
 
         menu.append(Gtk.SeparatorMenuItem())
@@ -80,9 +290,11 @@ class KeyRxTray:
 
         # Refresh profiles
         refresh_profiles = Gtk.MenuItem(label="↻ Refresh Profiles")
-        refresh_profiles.connect("activate", lambda _: self.update_profiles())
+        refresh_profiles.connect("activate", self.on_refresh_profiles)
         self.profiles_submenu.append(refresh_profiles)
         self.profiles_submenu.append(Gtk.SeparatorMenuItem())
+        self.no_profiles_item = Gtk.MenuItem(label="No profiles available")
+        self.no_profiles_item.set_sensitive(False)
 
         menu.append(Gtk.SeparatorMenuItem())
 
@@ -112,18 +324,137 @@ class KeyRxTray:
         return menu
 
     def api_get(self, endpoint: str) -> Optional[dict]:
-        """Make GET request to daemon API"""
+        """Make GET request to daemon API (None on failure)"""
         if MOCK_MODE:
             return self.mock_api_response(endpoint)
 
+        now = time.monotonic()
+        cached = self._cache.get(endpoint)
+        if cached and now < cached[0]:
+            return cached[2]
+
+        headers = {}
+        if cached and cached[1]:
+            headers["If-None-Match"] = cached[1]
+
         try:
-            response = requests.get(f"{DAEMON_API_BASE}{endpoint}", timeout=2)
-            response.raise_for_status()
-            return response.json()
+            response = daemon_session().get(
+                f"{DAEMON_API_BASE}{endpoint}",
+                headers=headers,
+                timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
+            )
+            if response.status_code == 304 and cached:
+                body = cached[2]
+            else:
+                response.raise_for_status()
+                body = json_loads(response.content)
         except Exception as e:
             print(f"API GET error: {e}", file=sys.stderr)
             return None
 
+        etag = response.headers.get("ETag") or (cached[1] if cached else None)
+        self._cache[endpoint] = (now + CACHE_TTL.get(endpoint, 0), etag, body)
+        return body
+
+    def api_get_bulk(self, endpoints: List[str]) -> Dict[str, Optional[dict]]:
+        """Fetch several endpoints in one round-trip via /api/bulk
+
+        Only endpoints missing from the cache are requested. The daemon
+        answers with each endpoint's status, ETag and body. Falls back to
+        individual api_get calls if the daemon has no bulk endpoint.
+        """
+        now = time.monotonic()
+        pending = [
+            endpoint for endpoint in endpoints
+            if not (endpoint in self._cache and now < self._cache[endpoint][0])
+        ]
+        if MOCK_MODE or not self._bulk_supported or len(pending) < 2:
+            return {endpoint: self.api_get(endpoint) for endpoint in endpoints}
+
+        try:
+            response = daemon_session().post(
+                f"{DAEMON_API_BASE}/api/bulk",
+                data=json_dumps({"endpoints": pending}),
+                headers=JSON_HEADERS,
+                timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
+            )
+        except Exception as e:
+            print(f"API bulk error: {e}", file=sys.stderr)
+            return {endpoint: None for endpoint in endpoints}
+
+        entries = None
+        content_type = response.headers.get("Content-Type", "")
+        if response.ok and content_type.startswith("application/json"):
+            try:
+                entries = json_loads(response.content)
+            except ValueError:
+                pass
+        if not isinstance(entries, dict):
+            # The daemon serves the web UI for unknown routes, so anything but
+            # a JSON object means there is no bulk endpoint; don't try again
+            self._bulk_supported = False
+            return {endpoint: self.api_get(endpoint) for endpoint in endpoints}
+
+        for endpoint in pending:
+            entry = entries.get(endpoint)
+            if (not isinstance(entry, dict) or entry.get("status") != 200
+                    or entry.get("body") is None):
+                continue
+            cached = self._cache.get(endpoint)
+            etag = entry.get("etag") or (cached[1] if cached else None)
+            self._cache[endpoint] = (now + CACHE_TTL.get(endpoint, 0), etag, entry.get("body"))
+        # Everything is cached now; anything the daemon left out is fetched singly
+        return {endpoint: self.api_get(endpoint) for endpoint in endpoints}
+
+    def fetch_status(self) -> Dict[str, Optional[dict]]:
+        """Fetch status and profiles for one update cycle
+
+        Any endpoint whose request failed gets its last known response. Once
+        the status request has failed for STALE_FAILURE_LIMIT consecutive
+        cycles, nothing stale is returned and the daemon counts as down.
+        """
+        endpoints = ["/api/status", "/api/profiles"]
+        results = self.api_get_bulk(endpoints)
+        if results["/api/status"] is not None:
+            self._failed_polls = 0
+        else:
+            self._failed_polls += 1
+            if self._failed_polls >= STALE_FAILURE_LIMIT:
+                return results
+
+        for endpoint in endpoints:
+            if results[endpoint] is None and endpoint in self._cache:
+                results[endpoint] = self._cache[endpoint][2]
+        return results
+
+    def run_async(self, func: Callable, *args, callback: Optional[Callable] = None):
+        """Run a blocking call on the HTTP worker
+
+        ``callback`` receives the result on the GTK main loop.
+        """
+        future = self._http.submit(func, *args)
+        if callback is not None:
+            future.add_done_callback(
+                lambda f: GLib.idle_add(self._deliver, callback, f)
+            )
+
+    def _deliver(self, callback: Callable, future: Future) -> bool:
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"Background request failed: {e}", file=sys.stderr)
+            result = None
+        try:
+            callback(result)
+        except Exception as e:
+            print(f"Failed to handle daemon response: {e}", file=sys.stderr)
+        return False  # One-shot idle callback
+
+    def invalidate_cache(self):
+        """Force the next api_get of every endpoint to revalidate"""
+        for endpoint, (_, etag, body) in self._cache.items():
+            self._cache[endpoint] = (0.0, etag, body)
+
     def api_post(self, endpoint: str, data: dict = None) -> bool:
         """Make POST request to daemon API"""
         if MOCK_MODE:
@@ -131,12 +462,14 @@ class KeyRxTray:
             return True
 
         try:
-            response = requests.post(
+            response = daemon_session().post(
                 f"{DAEMON_API_BASE}{endpoint}",
-                json=data,
-                timeout=2
+                data=json_dumps(data) if data is not None else None,
+                headers=JSON_HEADERS,
+                timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)
             )
             response.raise_for_status()
+            self.invalidate_cache()
             return True
         except Exception as e:
             print(f"API POST error: {e}", file=sys.stderr)
@@ -161,97 +494,311 @@ class KeyRxTray:
             }
         return {}
 
-    def update_status(self) -> bool:
-        """Update daemon status from API"""
-        status = self.api_get("/api/status")
-
+    def update_status(self, then: Optional[Callable] = None):
+        """Fetch daemon status and profiles in the background and refresh the UI
+
+        ``then`` is called on the main loop once the UI is updated.
+        """
+        def done(results):
+            results = results or {}
+            status = results.get("/api/status")
+            try:
+                self.apply_status(status)
+                if status:
+                    self.apply_profiles(results.get("/api/profiles"))
+            finally:
+                # Always continue, or a bad response would stop polling
+                if then is not None:
+                    then()
+
+        self.run_async(self.fetch_status, callback=done)
+
+    def apply_status(self, status: Optional[dict]):
+        """Update UI from a /api/status response"""
         if status:
             self.daemon_running = True
             self.current_profile = status.get("profile", "Unknown")
             enabled = status.get("remapping_enabled", True)
+            self.remapping_enabled = enabled
 
             # Update UI
-            self.status_item.set_label(f"Profile: {self.current_profile}")
-            self.toggle_item.set_active(enabled)
-            self.indicator.set_icon("input-keyboard" if enabled else "input-keyboard-symbolic")
-
-            # Update profiles list
-            if not hasattr(self, '_profiles_loaded'):
-                self.update_profiles()
-                self._profiles_loaded = True
+            self._menu_state = (f"Profile: {self.current_profile}", enabled)
+            if enabled:
+                self.set_icon("input-keyboard", "KeyRx: remapping enabled")
+            else:
+                self.set_icon("input-keyboard-symbolic", "KeyRx: remapping disabled")
         else:
             self.daemon_running = False
-            self.status_item.set_label("Status: Daemon not running")
-            self.indicator.set_icon("input-keyboard-symbolic")
+            self._menu_state = ("Status: Daemon not running", None)
+            self.set_icon("input-keyboard-symbolic", "KeyRx: daemon not running")
+
+        # The icon is always visible; menu items only matter once it opens
+        if self._menu_visible is not False:
+            self.refresh_menu()
+
+    def refresh_menu(self):
+        """Push the latest status into the menu widgets"""
+        if self._menu_state is None:
+            return
+        label, enabled = self._menu_state
+        if label != self._last_label:
+            self.status_item.set_label(label)
+            self._last_label = label
+        toggle_busy = self._toggle_source is not None or self._toggle_inflight
+        if enabled is not None and enabled != self._last_enabled and not toggle_busy:
+            # Reflect server state without posting it back as a toggle
+            self.toggle_item.handler_block(self._toggle_handler_id)
+            self.toggle_item.set_active(enabled)
+            self.toggle_item.handler_unblock(self._toggle_handler_id)
+            self._last_enabled = enabled
+
+    def set_icon(self, name: str, description: str):
+        """Change the indicator icon if it differs from the current one"""
+        if (name, description) != self._current_icon:
+            self.indicator.set_icon_full(name, description)
+            self._current_icon = (name, description)
+
+    def connect_event_stream(self):
+        """Start the event stream if the daemon is reachable"""
+        if MOCK_MODE or not self.daemon_running or not self.event_stream.supported:
+            return
+        self.event_stream.start()
+
+    def start_updates(self):
+        """Subscribe to daemon events and start polling"""
+        if not self.daemon_running and not MOCK_MODE:
+            print("Warning: KeyRx daemon is not running", file=sys.stderr)
+            print("Start daemon with: sudo systemctl start keyrx", file=sys.stderr)
+            print("Tray will continue and retry connection...", file=sys.stderr)
+        self.connect_event_stream()
+        self.start_polling()
+
+    def start_polling(self):
+        """Arm the status poll unless it is already scheduled"""
+        if self._poll_source is None:
+            self.schedule_poll()
+
+    def next_poll_interval(self) -> int:
+        """Pick the poll interval for the current daemon and menu state"""
+        if not self.daemon_running or self._failed_polls:
+            return self._backoff_interval
+        # Like apply_status, only a seen "hide" counts as closed
+        if self._menu_visible is False:
+            return BACKGROUND_POLL_INTERVAL
+        return POLL_INTERVAL
+
+    def schedule_poll(self):
+        """(Re)arm the status poll with a fresh interval"""
+        if self._poll_source is not None:
+            GLib.source_remove(self._poll_source)
+        self._poll_source = GLib.timeout_add_seconds(
+            self.next_poll_interval(), self.poll_status
+        )
 
-        return True  # Continue polling
+    def poll_status(self) -> bool:
+        """Poll status (periodic timer callback)"""
+        self._poll_source = None
+        was_running = self.daemon_running
+        self.update_status(then=lambda: self.on_poll_done(was_running))
+        return False  # Rescheduled by on_poll_done with a fresh interval
+
+    def on_poll_done(self, was_running: bool):
+        """Adjust backoff and reschedule after a poll completes"""
+        if not self._failed_polls:
+            self._backoff_interval = POLL_INTERVAL
+            if not was_running:
+                # A restarted daemon may have gained /api/events or /api/bulk
+                self.event_stream.supported = True
+                self._bulk_supported = True
+            self.connect_event_stream()
+        else:
+            self._backoff_interval = min(self._backoff_interval * 2, MAX_POLL_INTERVAL)
+        self.schedule_poll()
+
+    def on_menu_show(self, menu):
+        """Show fresh status and poll faster while the menu is open"""
+        self._menu_visible = True
+        self.refresh_menu()
+        self.update_status()
+        if self._poll_source is not None:
+            self.schedule_poll()
+
+    def on_menu_hide(self, menu):
+        """Fall back to the background poll interval"""
+        self._menu_visible = False
+        if self._poll_source is not None:
+            self.schedule_poll()
+
+    def on_daemon_event(self, event: dict) -> bool:
+        """Handle an event pushed by the daemon"""
+        data = event.get("data") or {}
+        if event.get("channel") == "profiles" and data.get("action") == "activated":
+            # Refetch rather than trust the event: status also carries
+            # remapping_enabled, and profiles need their active flags updated
+            self.run_async(self.invalidate_cache)
+            self.update_status()
+        return False  # One-shot idle callback
+
+    def on_event_stream_closed(self) -> bool:
+        """Refresh status once the event stream drops"""
+        # Re-arm the poll so a dead daemon switches to the backoff interval
+        self.update_status(then=self.schedule_poll)
+        return False  # One-shot idle callback
 
     def update_profiles(self):
-        """Refresh profiles submenu"""
-        # Clear existing profile items (keep refresh button and separator)
-        for item in self.profiles_submenu.get_children()[2:]:
-            self.profiles_submenu.remove(item)
-
-        profiles_data = self.api_get("/api/profiles")
-        if not profiles_data:
-            no_profiles = Gtk.MenuItem(label="No profiles available")
-            no_profiles.set_sensitive(False)
-            self.profiles_submenu.append(no_profiles)
-        else:
-            profiles = profiles_data.get("profiles", [])
-            for profile in profiles:
-                item = Gtk.CheckMenuItem(label=profile["name"])
-                item.set_active(profile.get("active", False))
-                item.connect("activate", self.on_switch_profile, profile["name"])
+        """Fetch profiles in the background and refresh the submenu"""
+        self.run_async(self.api_get, "/api/profiles", callback=self.apply_profiles)
+
+    def apply_profiles(self, profiles_data: Optional[dict]):
+        """Reconcile profiles submenu with a /api/profiles response"""
+        signature = None
+        if profiles_data:
+            signature = tuple(
+                (profile["name"], profile.get("active", False))
+                for profile in profiles_data.get("profiles", [])
+            )
+        if signature == self._profiles_signature and not self._profiles_dirty:
+            return
+        self._profiles_signature = signature
+        self._profiles_dirty = False
+
+        names = {name for name, _ in signature or ()}
+        for name in list(self._profile_items):
+            if name not in names:
+                item, _ = self._profile_items.pop(name)
+                self.profiles_submenu.remove(item)
+
+        # Items go after the refresh button and separator
+        for position, (name, active) in enumerate(signature or (), start=2):
+            if name in self._profile_items:
+                item, handler_id = self._profile_items[name]
+                if item.get_active() != active:
+                    # Reflect server state without re-sending the switch
+                    item.handler_block(handler_id)
+                    item.set_active(active)
+                    item.handler_unblock(handler_id)
+            else:
+                item = Gtk.CheckMenuItem(label=name)
+                item.set_active(active)
+                handler_id = item.connect("activate", self.on_switch_profile, name)
+                self._profile_items[name] = (item, handler_id)
                 self.profiles_submenu.append(item)
+                item.show()
+            self.profiles_submenu.reorder_child(item, position)
+
+        has_placeholder = self.no_profiles_item in self.profiles_submenu.get_children()
+        if signature is None and not has_placeholder:
+            self.profiles_submenu.append(self.no_profiles_item)
+            self.no_profiles_item.show()
+        elif signature is not None and has_placeholder:
+            self.profiles_submenu.remove(self.no_profiles_item)
 
-        self.profiles_submenu.show_all()
+    def on_refresh_profiles(self, widget):
+        """Reload profiles, bypassing the response cache"""
+        self.run_async(self.invalidate_cache)
+        self.update_profiles()
 
     def on_toggle_remapping(self, widget):
-        """Toggle remapping on/off"""
-        enabled = widget.get_active()
-        self.remapping_enabled = enabled
-
-        if self.api_post("/api/toggle", {"enabled": enabled}):
-            status = "enabled" if enabled else "disabled"
-            self.show_notification(
-                "KeyRx Remapping",
-                f"Remapping {status}",
-                "input-keyboard"
-            )
-        else:
-            # Revert on failure
-            widget.set_active(not enabled)
-            self.show_notification(
-                "KeyRx Error",
-                "Failed to toggle remapping",
-                "dialog-error"
-            )
+        """Toggle remapping on/off (debounced)"""
+        self._last_enabled = widget.get_active()
+        if self._toggle_source is not None:
+            GLib.source_remove(self._toggle_source)
+        self._toggle_source = GLib.timeout_add(CLICK_DEBOUNCE, self.send_toggle)
+
+    def send_toggle(self) -> bool:
+        """Send the settled toggle state to the daemon"""
+        if self._toggle_inflight:
+            return True  # Retry once the previous request completes
+        self._toggle_source = None
+
+        enabled = self.toggle_item.get_active()
+        if enabled == self.remapping_enabled:
+            return False  # Clicks cancelled out
+
+        self._toggle_inflight = True
+
+        def done(ok):
+            self._toggle_inflight = False
+            if ok:
+                self.remapping_enabled = enabled
+                status = "enabled" if enabled else "disabled"
+                self.show_notification(
+                    "KeyRx Remapping",
+                    f"Remapping {status}",
+                    "input-keyboard"
+                )
+            elif self._toggle_source is None:
+                # Revert on failure, without re-sending the toggle
+                self.toggle_item.handler_block(self._toggle_handler_id)
+                self.toggle_item.set_active(self.remapping_enabled)
+                self.toggle_item.handler_unblock(self._toggle_handler_id)
+                self._last_enabled = self.remapping_enabled
+                self.show_notification(
+                    "KeyRx Error",
+                    "Failed to toggle remapping",
+                    "dialog-error"
+                )
+
+        self.run_async(self.api_post, "/api/toggle", {"enabled": enabled}, callback=done)
+        return False
 
     def on_switch_profile(self, widget, profile_name: str):
-        """Switch to different profile"""
-        if self.api_post("/api/profiles/activate", {"name": profile_name}):
-            self.current_profile = profile_name
-            self.show_notification(
-                "KeyRx Profile",
-                f"Switched to profile: {profile_name}",
-                "input-keyboard"
-            )
+        """Switch to different profile (debounced)"""
+        # The click toggled the item locally; resync on the next reconcile
+        self._profiles_dirty = True
+        self._pending_profile = profile_name
+        if self._profile_source is not None:
+            GLib.source_remove(self._profile_source)
+        self._profile_source = GLib.timeout_add(CLICK_DEBOUNCE, self.send_profile_switch)
+
+    def send_profile_switch(self) -> bool:
+        """Activate the last clicked profile"""
+        if self._profile_inflight:
+            return True  # Retry once the previous request completes
+        self._profile_source = None
+
+        profile_name = self._pending_profile
+        self._profile_inflight = True
+
+        def done(ok):
+            self._profile_inflight = False
+            if ok:
+                self.current_profile = profile_name
+                self.show_notification(
+                    "KeyRx Profile",
+                    f"Switched to profile: {profile_name}",
+                    "input-keyboard"
+                )
+            else:
+                self.show_notification(
+                    "KeyRx Error",
+                    f"Failed to switch to profile: {profile_name}",
+                    "dialog-error"
+                )
             self.update_profiles()
-        else:
-            self.show_notification(
-                "KeyRx Error",
-                f"Failed to switch to profile: {profile_name}",
-                "dialog-error"
-            )
+
+        self.run_async(
+            self.api_post,
+            "/api/profiles/activate",
+            {"name": profile_name},
+            callback=done
+        )
+        return False
 
     def on_open_web_ui(self, widget):
         """Open web UI in default browser"""
-        webbrowser.open(WEB_UI_URL)
+        self.open_uri(WEB_UI_URL)
 
     def on_open_settings(self, widget):
         """Open settings page in web UI"""
-        webbrowser.open(f"{WEB_UI_URL}/#/settings")
+        self.open_uri(f"{WEB_UI_URL}/#/settings")
+
+    def open_uri(self, uri: str):
+        """Open a URI with the default handler, in-process via GIO"""
+        try:
+            Gio.AppInfo.launch_default_for_uri(uri, None)
+        except GLib.Error as e:
+            print(f"Failed to open {uri}: {e.message}", file=sys.stderr)
 
     def on_about(self, widget):
         """Show about dialog"""
@@ -268,6 +815,7 @@ class KeyRxTray:
 
     def on_quit(self, widget):
         """Quit tray application (daemon keeps running)"""
+        self._http.shutdown(wait=False)
         Notify.uninit()
         Gtk.main_quit()
 
@@ -277,27 +825,15 @@ class KeyRxTray:
         notification.show()
 
 
-def check_daemon_running() -> bool:
-    """Check if daemon is accessible"""
-    if MOCK_MODE:
-        return True
-
-    try:
-        response = requests.get(f"{DAEMON_API_BASE}/api/status", timeout=2)
-        return response.status_code == 200
-    except:
-        return False
-
-
 def main():
     # Handle Ctrl+C gracefully
     signal.signal(signal.SIGINT, signal.SIG_DFL)
 
-    # Check if daemon is running (warn but don't exit)
-    if not check_daemon_running() and not MOCK_MODE:
-        print("Warning: KeyRx daemon is not running", file=sys.stderr)
-        print("Start daemon with: sudo systemctl start keyrx", file=sys.stderr)
-        print("Tray will continue and retry connection...", file=sys.stderr)
+    if (DAEMON_API_BASE.startswith(UNIX_SOCKET_SCHEME)
+            and importlib.util.find_spec("requests_unixsocket") is None):
+        print(f"Error: {DAEMON_API_BASE} requires requests-unixsocket", file=sys.stderr)
+        print("Install with: pip3 install --user requests-unixsocket", file=sys.stderr)
+        sys.exit(1)
 
     # Create tray
     tray = KeyRxTray()